@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from dissect.util.ts import from_unix
 
-from dissect.target.exceptions import FileNotFoundError, UnsupportedPluginError
+from dissect.target.exceptions import FileNotFoundError, FilesystemError, UnsupportedPluginError
 from dissect.target.filesystem import FilesystemEntry, LayerFilesystemEntry
 from dissect.target.helpers.record import TargetRecordDescriptor
 from dissect.target.plugin import Plugin, arg, export
@@ -79,17 +79,19 @@ class WalkFsPlugin(Plugin):
             fs_types (string[]): list of filesystem type(s) of the entry.
         """
 
-        path = self.target.fs.path(walkfs_path)
-
-        if not path.exists():
-            self.target.log.error("No such directory: '%s'", walkfs_path)
+        # Resolve the starting entry once and reuse it, instead of looking up the same path for the
+        # existence check, the directory check and again when starting the recursion
+        try:
+            root = self.target.fs.get(walkfs_path)
+        except FilesystemError:
+            self.target.log.error("No such directory: '%s'", walkfs_path)  # noqa: TRY400
             return
 
-        if not path.is_dir():
+        if not root.is_dir():
             self.target.log.error("Not a directory: '%s'", walkfs_path)
             return
 
-        for entry in self.target.fs.recurse(walkfs_path):
+        for entry in root.recurse():
             try:
                 yield from generate_record(self.target, entry, capability)
             except FileNotFoundError as e:  # noqa: PERF203
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
+import stat
+import struct
 import urllib.parse
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, Union, get_args
 
 from dissect.database.ese import ESE
@@ -17,6 +20,7 @@ from dissect.target.plugins.apps.browser.iexplore import InternetExplorerPlugin
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from datetime import datetime
     from pathlib import Path
 
     from dissect.database.ese.record import Record as EseRecord
@@ -53,13 +57,15 @@ SearchIndexActivityRecord = TargetRecordDescriptor(
     ],
 )
 
-RE_URL = re.compile(r"(?P<browser>.+)\:\/\/\{(?P<sid>.+)\}\/(?P<url>.+)$")
+RE_URL = re.compile(r"(?P<browser>.+?)\:\/\/\{(?P<sid>.+?)\}\/(?P<url>.+)$")
 
 BROWSER_RECORD_MAP = {
     "iehistory": InternetExplorerPlugin.BrowserHistoryRecord,
     "winrt": EdgePlugin.BrowserHistoryRecord,
 }
 
+UINT64 = struct.Struct("<Q")
+
 SearchIndexRecords = Union[SearchIndexRecord, SearchIndexActivityRecord, BrowserHistoryRecord]  # noqa: UP007
 
 
@@ -85,32 +91,36 @@ class SearchIndexPlugin(Plugin):
         self.databases = set(self.find_databases())
 
     def find_databases(self) -> Iterator[tuple[Path, UserDetails | None]]:
+        # Files are deduplicated on their (device, inode) identity, the same identity ``Path.samefile`` compares,
+        # which lets us use a set lookup instead of comparing every candidate against every seen file.
         seen = set()
 
         for system_path in self.SYSTEM_PATHS:
-            if (path := self.target.fs.path(system_path)).is_file():
-                try:
-                    if any(seen_file.samefile(path) for seen_file in seen):
-                        continue
-                except FilesystemError:
-                    pass
-
-                seen.add(path)
+            if self._is_new_file(path := self.target.fs.path(system_path), seen):
                 yield path.resolve(), None
 
         for user_details in self.target.user_details.all_with_home():
             for user_path in self.USER_PATHS:
                 for path in user_details.home_path.glob(user_path):
-                    if not path.is_file():
-                        continue
-                    try:
-                        if any(seen_file.samefile(path) for seen_file in seen):
-                            continue
-                    except FilesystemError:
-                        pass
+                    if self._is_new_file(path, seen):
+                        yield path.resolve(), user_details
+
+    @staticmethod
+    def _is_new_file(path: Path, seen: set[tuple[int, int]]) -> bool:
+        """Return whether ``path`` is a file whose identity is not in ``seen`` yet, adding it if so.
+
+        Uses a single ``stat`` call for both the file type check and the identity lookup.
+        """
+        try:
+            path_stat = path.stat()
+        except FilesystemError:
+            return False
 
-                    seen.add(path)
-                    yield path.resolve(), user_details
+        if not stat.S_ISREG(path_stat.st_mode) or (identity := (path_stat.st_dev, path_stat.st_ino)) in seen:
+            return False
+
+        seen.add(identity)
+        return True
 
     def check_compatible(self) -> None:
         if not self.databases:
@@ -159,9 +169,10 @@ class SearchIndexPlugin(Plugin):
         with path.open("rb") as fh:
             db = ESE(fh)
             table = db.table("SystemIndex_PropertyStore")
+            columns = TableRecord.map_columns(table)
 
             for record in table.records():
-                yield from self.build_record(TableRecord(table, record), user_details, path)
+                yield from self.build_record(TableRecord(table, record, columns), user_details, path)
 
     def parse_sqlite(self, path: Path, user_details: UserDetails | None) -> Iterator[SearchIndexRecords]:
         """Parse the SQLite3 ``SystemIndex_1_PropertyStore`` table."""
@@ -179,51 +190,48 @@ class SearchIndexPlugin(Plugin):
                 self.target.log.warning("Database %s does not have a table called 'SystemIndex_1_PropertyStore'", path)
                 return
 
-            current_work_id = None
-            values = {}
-
-            for row in table.rows():
-                work_id = row.get("WorkId")
-                if current_work_id is None:
-                    current_work_id = work_id
-                if work_id != current_work_id:
-                    yield from self.build_record(values, user_details, path)
-                    current_work_id = work_id
-                    values = {}
+            # Rows are stored ordered by ``WorkId``, so we can group them on the fly and only keep the
+            # values of a single ``WorkId`` in memory at a time.
+            for _, rows in groupby(table.rows(), key=lambda row: row.get("WorkId")):
+                values = {}
 
-                if value := row.get("Value"):
-                    column_name = columns[row.get("ColumnId")]
-                    values[column_name] = value
+                for row in rows:
+                    # Skip values of columns that are not described in the metadata table
+                    if (column_name := columns.get(row.get("ColumnId"))) and (value := row.get("Value")):
+                        values[column_name] = value
 
-            yield from self.build_record(values, user_details, path)
+                yield from self.build_record(values, user_details, path)
 
     def build_record(
         self, values: dict[str, Any] | TableRecord, user_details: UserDetails | None, db_path: Path
     ) -> Iterator[SearchIndexRecords]:
         """Build a ``SearchIndexRecord``, ``SearchIndexActivityRecord`` or ``HistoryRecord``."""
 
-        if values.get("System_ItemType") == "ActivityHistoryItem":
+        # Bind the lookup method once, it is used for every field of every record.
+        get = values.get
+
+        if get("System_ItemType") == "ActivityHistoryItem":
             yield SearchIndexActivityRecord(
-                ts_start=wintimestamp(int.from_bytes(values.get("System_ActivityHistory_StartTime", b""), "little")),
-                ts_end=wintimestamp(int.from_bytes(values.get("System_ActivityHistory_EndTime", b""), "little")),
-                duration=int.from_bytes(values.get("System_ActivityHistory_ActiveDuration", b""), "little"),
-                application_name=values.get("System_Activity_AppDisplayName"),
-                application_id=values.get("System_ActivityHistory_AppId"),
-                activity_id=values.get("System_ActivityHistory_AppActivityId"),
+                ts_start=parse_filetime(get("System_ActivityHistory_StartTime")),
+                ts_end=parse_filetime(get("System_ActivityHistory_EndTime")),
+                duration=parse_uint(get("System_ActivityHistory_ActiveDuration")),
+                application_name=get("System_Activity_AppDisplayName"),
+                application_id=get("System_ActivityHistory_AppId"),
+                activity_id=get("System_ActivityHistory_AppActivityId"),
                 source=db_path,
                 _target=self.target,
             )
 
-        elif values.get("System_Search_Store") in ("iehistory", "winrt"):
-            system_itemurl = values.get("System_ItemUrl")
+        elif get("System_Search_Store") in BROWSER_RECORD_MAP:
+            system_itemurl = get("System_ItemUrl")
 
-            if not system_itemurl or not (match := RE_URL.match(system_itemurl)):
+            if not system_itemurl or not (parts := parse_item_url(system_itemurl)):
                 self.target.log.warning(
                     "Unable to parse System_ItemUrl: %r (%r) in %s", system_itemurl, values, db_path
                 )
                 return
 
-            browser, sid, url = match.groupdict().values()
+            browser, sid, url = parts
 
             if not (CurrentBrowserHistoryRecord := BROWSER_RECORD_MAP.get(browser)):
                 self.target.log.warning(
@@ -238,7 +246,7 @@ class SearchIndexPlugin(Plugin):
             if not user and user_details:
                 user = user_details.user
 
-            url = values.get("System_Link_TargetUrl") or url
+            url = get("System_Link_TargetUrl") or url
             host = None
 
             if url:
@@ -248,10 +256,10 @@ class SearchIndexPlugin(Plugin):
                     pass
 
             yield CurrentBrowserHistoryRecord(
-                ts=wintimestamp(int.from_bytes(values.get("System_Link_DateVisited", b""), "little")),
+                ts=parse_filetime(get("System_Link_DateVisited")),
                 browser=browser,
                 url=url,
-                title=values.get("System_Title"),
+                title=get("System_Title"),
                 host=host,
                 source=db_path,
                 _user=user,
@@ -261,29 +269,69 @@ class SearchIndexPlugin(Plugin):
         # System_Search_Store = "file"
         else:
             yield SearchIndexRecord(
-                ts=wintimestamp(int.from_bytes(values.get("System_Search_GatherTime", b""), "little")),
-                ts_mtime=wintimestamp(int.from_bytes(values.get("System_DateModified", b""), "little")),
-                ts_btime=wintimestamp(int.from_bytes(values.get("System_DateCreated", b""), "little")),
-                ts_atime=wintimestamp(int.from_bytes(values.get("System_DateAccessed", b""), "little")),
-                path=values.get("System_ItemPathDisplay"),
-                type=values.get("System_MIMEType")
-                or values.get("System_ContentType")
-                or values.get("System_ItemTypeText"),
-                size=int.from_bytes(b_size, "little") if (b_size := values.get("System_Size")) else None,
-                data=values.get("System_Search_AutoSummary"),
+                ts=parse_filetime(get("System_Search_GatherTime")),
+                ts_mtime=parse_filetime(get("System_DateModified")),
+                ts_btime=parse_filetime(get("System_DateCreated")),
+                ts_atime=parse_filetime(get("System_DateAccessed")),
+                path=get("System_ItemPathDisplay"),
+                type=get("System_MIMEType") or get("System_ContentType") or get("System_ItemTypeText"),
+                size=parse_uint(b_size) if (b_size := get("System_Size")) else None,
+                data=get("System_Search_AutoSummary"),
                 source=db_path,
                 _target=self.target,
             )
 
 
+def parse_uint(value: bytes | None) -> int:
+    """Parse a little-endian unsigned integer value as stored in the search index."""
+    if value and len(value) == 8:
+        return UINT64.unpack(value)[0]
+    return int.from_bytes(value or b"", "little")
+
+
+def parse_filetime(value: bytes | None) -> datetime:
+    """Parse a little-endian ``FILETIME`` value as stored in the search index to a datetime."""
+    return wintimestamp(parse_uint(value))
+
+
+def parse_item_url(value: str) -> tuple[str, str, str] | None:
+    """Split a ``System_ItemUrl`` value such as ``winrt://{S-1-5-21-...}/https://example.com``
+    into its browser, sid and url parts.
+
+    The value is split on the first ``://{`` and the first ``}/`` after it, so a url containing ``}/`` is kept
+    whole. Plain string partitioning handles the common case. The non-greedy ``RE_URL`` regex is only used as a
+    fallback when partitioning results in an empty part, and also splits on the first separators that result in
+    non-empty parts.
+    """
+    browser, _, remainder = value.partition("://{")
+    sid, _, url = remainder.partition("}/")
+
+    if browser and sid and url:
+        return browser, sid, url
+
+    if match := RE_URL.match(value):
+        return match.group("browser", "sid", "url")
+
+    return None
+
+
 class TableRecord:
-    def __init__(self, table: EseTable, record: EseRecord):
+    def __init__(self, table: EseTable, record: EseRecord, columns: dict[str, str] | None = None):
         self.table = table
         self.record = record
 
-        # Translates e.g. ``System_DateModified`` to ``15F-System_DateModified`` as these column name prefixes might
-        # be dynamic based on the system version.
-        self.columns = {col.split("-", maxsplit=1)[-1]: col for col in table.column_names}
+        # The column mapping is the same for every record of a table, so callers iterating over many records
+        # should build it once using ``map_columns`` and pass it along.
+        self.columns = columns if columns is not None else self.map_columns(table)
+
+    @staticmethod
+    def map_columns(table: EseTable) -> dict[str, str]:
+        """Map the column names of the given table without their prefix to the full column name.
+
+        Translates e.g. ``System_DateModified`` to ``15F-System_DateModified`` as these column name prefixes might
+        be dynamic based on the system version.
+        """
+        return {col.split("-", maxsplit=1)[-1]: col for col in table.column_names}
 
     def get(self, key: str, default: Any | None = None) -> Any:
         return self.record.get(self.columns.get(key, default))
@@ -125,3 +125,17 @@ def test_walkfs_xattr(target_unix: Target, fs_unix: VirtualFilesystem) -> None:
     ]
     assert results[-1].effective
     assert results[-1].root_id is None
+
+
+def test_walkfs_invalid_path(target_unix: Target, fs_unix: VirtualFilesystem, caplog: pytest.LogCaptureFixture) -> None:
+    """Test if the WalkFS plugin handles non-existent and non-directory paths gracefully."""
+
+    fs_unix.map_file_entry("/path/to/some/file", VirtualFile(fs_unix, "file", None))
+
+    target_unix.add_plugin(WalkFsPlugin)
+
+    assert list(target_unix.walkfs(walkfs_path="/path/to/nowhere")) == []
+    assert "No such directory: '/path/to/nowhere'" in caplog.text
+
+    assert list(target_unix.walkfs(walkfs_path="/path/to/some/file")) == []
+    assert "Not a directory: '/path/to/some/file'" in caplog.text
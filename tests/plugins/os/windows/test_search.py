@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from dissect.target.plugins.os.windows.search import SearchIndexPlugin
+import pytest
+
+from dissect.target.plugins.os.windows.search import (
+    SearchIndexPlugin,
+    parse_filetime,
+    parse_item_url,
+    parse_uint,
+)
 from tests._utils import absolute_path
 from tests.conftest import add_win_user
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from dissect.target.filesystem import VirtualFilesystem
     from dissect.target.helpers.regutil import VirtualHive
     from dissect.target.target import Target
@@ -173,3 +183,100 @@ def test_windows_search_sqlite(
     assert records[711].host == "www.bing.com"
     assert records[711].source == "\\sysvol\\ProgramData\\Microsoft\\Search\\Data\\Applications\\Windows\\Windows.db"
     assert records[711].user_id == user_sid
+
+
+def create_search_sqlite(path: Path, metadata: list[tuple[int, str]], rows: list[tuple[int, int, bytes | str]]) -> None:
+    """Create a minimal Windows 11 Search SQLite3 database with the given metadata and property store rows."""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE SystemIndex_1_PropertyStore_Metadata (Id INTEGER PRIMARY KEY, UniqueKey TEXT)")
+    db.execute(
+        "CREATE TABLE SystemIndex_1_PropertyStore (WorkId INTEGER, ColumnId INTEGER, Value BLOB, "
+        "PRIMARY KEY (WorkId, ColumnId)) WITHOUT ROWID"
+    )
+    db.executemany("INSERT INTO SystemIndex_1_PropertyStore_Metadata VALUES (?, ?)", metadata)
+    db.executemany("INSERT INTO SystemIndex_1_PropertyStore VALUES (?, ?, ?)", rows)
+    db.commit()
+    db.close()
+
+
+def test_windows_search_sqlite_empty(target_win: Target, fs_win: VirtualFilesystem, tmp_path: Path) -> None:
+    """Test that an empty ``SystemIndex_1_PropertyStore`` table does not yield any records."""
+
+    db_path = tmp_path.joinpath("Windows.db")
+    create_search_sqlite(db_path, [(1, "4447-System_ItemPathDisplay")], [])
+    fs_win.map_file("ProgramData/Microsoft/Search/Data/Applications/Windows/Windows.db", str(db_path))
+
+    target_win.add_plugin(SearchIndexPlugin)
+
+    assert list(target_win.search()) == []
+
+
+def test_windows_search_sqlite_unknown_column(target_win: Target, fs_win: VirtualFilesystem, tmp_path: Path) -> None:
+    """Test that property store values with a ``ColumnId`` missing from the metadata table are skipped."""
+
+    db_path = tmp_path.joinpath("Windows.db")
+    create_search_sqlite(
+        db_path,
+        [(1, "4447-System_ItemPathDisplay"), (2, "4448-System_Size")],
+        [
+            (1, 1, "C:\\Users\\User\\file.txt"),
+            (1, 2, (1337).to_bytes(8, "little")),
+            (1, 3, b"unknown column"),
+            (2, 3, b"only an unknown column"),
+        ],
+    )
+    fs_win.map_file("ProgramData/Microsoft/Search/Data/Applications/Windows/Windows.db", str(db_path))
+
+    target_win.add_plugin(SearchIndexPlugin)
+    records = list(target_win.search())
+
+    assert len(records) == 2
+
+    assert records[0].path == "C:\\Users\\User\\file.txt"
+    assert records[0].size == 1337
+
+    assert records[1].path is None
+    assert records[1].size is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(
+            "winrt://{S-1-5-21-1001}/https://www.bing.com/search?q=test",
+            ("winrt", "S-1-5-21-1001", "https://www.bing.com/search?q=test"),
+            id="winrt",
+        ),
+        pytest.param(
+            "iehistory://{S-1-5-21-1001}/https://example.com/a}/b",
+            ("iehistory", "S-1-5-21-1001", "https://example.com/a}/b"),
+            id="url-with-separator",
+        ),
+        pytest.param(
+            "winrt://{}/x}/https://example.com",
+            ("winrt", "}/x", "https://example.com"),
+            id="regex-fallback",
+        ),
+        pytest.param("garbage", None, id="no-separators"),
+        pytest.param("winrt://{S-1-5-21-1001}/", None, id="empty-url"),
+        pytest.param("://{S-1-5-21-1001}/https://example.com", None, id="empty-browser"),
+    ],
+)
+def test_parse_item_url(value: str, expected: tuple[str, str, str] | None) -> None:
+    """Test splitting ``System_ItemUrl`` values into browser, sid and url parts."""
+    assert parse_item_url(value) == expected
+
+
+def test_parse_uint() -> None:
+    """Test parsing little-endian integers with both the 8-byte struct path and the ``int.from_bytes`` fallback."""
+    assert parse_uint(None) == 0
+    assert parse_uint(b"") == 0
+    assert parse_uint(b"\x39\x05") == 1337
+    assert parse_uint((2**64 - 1).to_bytes(8, "little")) == 2**64 - 1
+    assert parse_uint(bytes.fromhex("00b0dcbf4d0fd901")) == 0x01D90F4DBFDCB000
+
+
+def test_parse_filetime() -> None:
+    """Test parsing ``FILETIME`` values, where a missing value is treated as ``FILETIME`` 0."""
+    assert parse_filetime(None) == datetime(1601, 1, 1, tzinfo=timezone.utc)
+    assert parse_filetime((116444736000000000).to_bytes(8, "little")) == datetime(1970, 1, 1, tzinfo=timezone.utc)